@@ -1,62 +1,244 @@
 import os
+import pickle
 import random
 import sys
 import pygame
 import time
 import threading
 import queue
-from moviepy.editor import VideoFileClip
+import concurrent.futures
+import functools
+import numpy as np
+import av
+from av.codec.hwaccel import HWAccel, hwdevices_available
+from av.video.reformatter import Interpolation, VideoReformatter
+
+VIDEO_EXTENSIONS = frozenset({"mov", "mp4", "avi", "mkv"})
+
+# Hardware decoders to try, in order of preference
+HWACCEL_DEVICE_TYPES = ("videotoolbox", "d3d11va", "cuda", "vaapi", "qsv")
+
+# Memory the frame ring may use for read-ahead, and its slot count limits
+FRAME_RING_BYTES = 512 * 1024 * 1024
+FRAME_RING_MIN_SLOTS = 8
+FRAME_RING_MAX_SLOTS = 128
+
+METADATA_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "randomvideo", "meta.pickle")
+
+class FrameRing:
+    """Single-producer/single-consumer ring of preallocated frame buffers"""
+
+    def __init__(self, capacity, frame_shape):
+        if capacity & (capacity - 1):
+            raise ValueError("FrameRing capacity must be a power of two")
+        self.capacity = capacity
+        self._mask = capacity - 1
+        self._slots = list(np.empty((capacity,) + tuple(frame_shape), dtype=np.uint8))
+        self._timestamps = [0.0] * capacity
+        # Only the producer moves head and only the consumer moves tail
+        self._head = 0
+        self._tail = 0
+        self._reading = False
+        self._closed = False
+        self._not_empty = threading.Event()
+        self._not_full = threading.Event()
+
+    def __len__(self):
+        return self._head - self._tail
+
+    @staticmethod
+    def capacity_for(frame_shape, byte_budget=FRAME_RING_BYTES):
+        """Return the largest power-of-two slot count whose frames fit in byte_budget"""
+        frame_bytes = int(np.prod(frame_shape))
+        slots = max(1, byte_budget // max(1, frame_bytes))
+        capacity = 1 << (slots.bit_length() - 1)
+        return max(FRAME_RING_MIN_SLOTS, min(FRAME_RING_MAX_SLOTS, capacity))
+
+    def acquire(self, frame_shape):
+        """Return the next free slot to write a frame into, waiting while the ring is full.
+
+        Returns None if the ring is closed, e.g. because playback was stopped.
+        """
+        while self._head - self._tail >= self.capacity:
+            if self._closed:
+                return None
+            self._not_full.clear()
+            if self._head - self._tail < self.capacity or self._closed:
+                continue
+            self._not_full.wait()
+        index = self._head & self._mask
+        slot = self._slots[index]
+        if slot.shape != frame_shape:
+            # The target size changed; the slot is free, so it can be replaced
+            slot = self._slots[index] = np.empty(frame_shape, dtype=np.uint8)
+        return slot
+
+    def commit(self, timestamp):
+        """Publish the slot returned by the last acquire(), to be shown at timestamp seconds"""
+        self._timestamps[self._head & self._mask] = timestamp
+        self._head += 1
+        # The consumer can only be waiting if the ring was empty before this frame
+        if self._head - self._tail == 1:
+            self._not_empty.set()
+
+    def close(self):
+        """Mark the end of the stream; get() returns None once the ring is drained"""
+        self._closed = True
+        self._not_empty.set()
+        self._not_full.set()
+
+    def get(self, timeout=None):
+        """Return the oldest (frame, timestamp), or None at the end of the stream.
+
+        The returned array is a view into the ring and stays valid until the next call.
+        """
+        if self._reading:
+            self._tail += 1
+            self._reading = False
+            # The producer can only be waiting if the ring was full before this release
+            if self._head - self._tail == self.capacity - 1:
+                self._not_full.set()
+        while self._head == self._tail:
+            if self._closed:
+                return None
+            self._not_empty.clear()
+            if self._head != self._tail or self._closed:
+                continue
+            if not self._not_empty.wait(timeout):
+                raise queue.Empty
+        self._reading = True
+        index = self._tail & self._mask
+        return self._slots[index], self._timestamps[index]
 
 class FrameLoader(threading.Thread):
-    def __init__(self, video_path, start_time, end_time, frame_queue, actual_fps, preload_size=120):
+    # Hardware device types that failed to initialize, so they aren't retried per video
+    _failed_hwaccel_devices = set()
+
+    def __init__(self, video_path, start_time, end_time, frame_ring, actual_fps, target_size):
         super().__init__()
         self.video_path = video_path
         self.start_time = start_time
         self.end_time = end_time
-        self.frame_queue = frame_queue
+        self.frame_ring = frame_ring
         self.actual_fps = actual_fps
-        self.preload_size = preload_size
+        self.target_size = target_size
+        # frame.reformat() builds a new scaler on every call; one reformatter
+        # keeps its SwsContext for the whole video and only rebuilds it when
+        # the target size changes
+        self.reformatter = VideoReformatter()
         self.daemon = True
         self.stop_event = threading.Event()
         self.error = None
-        self.clip = None
 
     def run(self):
+        container = None
         try:
-            self.clip = VideoFileClip(self.video_path)
-            subclip = (self.clip.subclip(self.start_time, self.end_time)
-                      .set_fps(self.actual_fps))
-            
-            for frame in subclip.iter_frames(fps=self.actual_fps, dtype="uint8"):
-                if self.stop_event.is_set():
+            container = self._open_container()
+            stream = container.streams.video[0]
+            stream.thread_type = "AUTO"
+            # Jump straight to the keyframe before start_time; timestamps are
+            # measured from the stream's own start, which is not always zero
+            start_pts = stream.start_time or 0
+            container.seek(start_pts + int(self.start_time / stream.time_base), stream=stream,
+                           any_frame=False, backward=True)
+
+            # Repeat or skip decoded frames so the output runs at the playback fps
+            frame_step = 1.0 / self.actual_fps
+            frame_duration = 1.0 / float(stream.average_rate or self.actual_fps)
+            # Output frames sit on an exact start_time + n * frame_step grid,
+            # so their timestamps never accumulate rounding drift
+            output_index = 0
+            # Ticks that land exactly on a frame boundary (e.g. equal source and
+            # playback rates) would otherwise pick a frame by rounding noise,
+            # showing one twice and skipping the next; end each frame's span
+            # half an interval early so each tick takes its nearest frame
+            boundary_margin = 0.5 * min(frame_step, frame_duration)
+            start_time = self.start_time
+            end_time = self.end_time
+            next_time = start_time
+
+            # Keep the per-frame work to local lookups and float arithmetic;
+            # stream.time_base is a Fraction, which is slow to multiply
+            time_base = float(stream.time_base)
+            is_stopped = self.stop_event.is_set
+            put_frame = self._put_frame
+            reformat = self.reformatter.reformat
+
+            for frame in container.decode(stream):
+                if is_stopped() or next_time >= end_time:
                     break
-                    
-                try:
-                    self.frame_queue.put(frame, timeout=1)
-                except queue.Full:
-                    if self.stop_event.is_set():
-                        break
+                pts = frame.pts
+                if pts is None:
                     continue
-                    
-                while (self.frame_queue.qsize() >= self.preload_size and 
-                       not self.stop_event.is_set()):
-                    time.sleep(0.01)
-                    
+                frame_time = (pts - start_pts) * time_base
+                if frame_time >= end_time:
+                    break
+                frame_end = frame_time + frame_duration - boundary_margin
+                # Drop frames between the keyframe and start_time (and frames
+                # skipped by a lower playback fps) without converting them
+                if frame_end <= next_time:
+                    continue
+
+                # Let libswscale scale to the display size while converting to RGB.
+                # PyAV's reformatter always writes into a frame it allocates and
+                # has no destination-buffer argument, so the output can't land in
+                # the ring slot directly; to_ndarray() is a view of that frame,
+                # which leaves the copy in _put_frame as the only one per frame
+                target_w, target_h = self.target_size
+                arr = reformat(frame, width=target_w, height=target_h, format="rgb24",
+                               interpolation=Interpolation.BILINEAR).to_ndarray()
+                while next_time < frame_end and next_time < end_time:
+                    if not put_frame(arr, next_time - start_time):
+                        return
+                    output_index += 1
+                    next_time = start_time + output_index * frame_step
+
         except Exception as e:
             self.error = e
             print(f"FrameLoader error: {e}")
         finally:
-            if self.clip is not None:
-                self.clip.close()
+            if container is not None:
+                container.close()
+            self.frame_ring.close()
+
+    def _open_container(self):
+        """Open the video with a hardware decoder if one is available, else in software"""
+        available = hwdevices_available()
+        for device_type in HWACCEL_DEVICE_TYPES:
+            if device_type not in available or device_type in self._failed_hwaccel_devices:
+                continue
             try:
-                self.frame_queue.put(None, timeout=1)
-            except queue.Full:
-                pass
+                # Codecs the device can't handle fall back to software decoding
+                hwaccel = HWAccel(device_type=device_type, allow_software_fallback=True)
+                return av.open(self.video_path, hwaccel=hwaccel)
+            except av.FFmpegError as e:
+                # Errors in the file itself show up here too; only blame the
+                # device if the same file opens fine in software
+                try:
+                    av.open(self.video_path).close()
+                except av.FFmpegError:
+                    raise e from None
+                print(f"Hardware decoding with {device_type} unavailable: {e}")
+                self._failed_hwaccel_devices.add(device_type)
+        return av.open(self.video_path)
+
+    def _put_frame(self, frame, timestamp):
+        """Copy a frame into the ring, returning False once the loader has been stopped"""
+        # Blocks while the ring is full and wakes as soon as a slot is freed
+        slot = self.frame_ring.acquire(frame.shape)
+        if slot is None or self.stop_event.is_set():
+            return False
+        np.copyto(slot, frame)
+        self.frame_ring.commit(timestamp)
+        return True
+
+    def set_target_size(self, target_size):
+        """Change the size decoded frames are scaled to, e.g. after a window resize"""
+        self.target_size = target_size
 
     def stop(self):
         self.stop_event.set()
-        if self.clip is not None:
-            self.clip.close()
+        self.frame_ring.close()
 
 class MoviePlayer:
     def __init__(self, movies_dir, min_interval, max_interval, target_fps=24, max_videos=None):
@@ -71,6 +253,7 @@ class MoviePlayer:
         self.max_interval = max_interval
         self.target_fps = target_fps
         self.max_videos = max_videos
+        self._metadata_cache = self._load_metadata_cache()
         self.movie_files, self.movie_durations, self.movie_fps, self.movie_sizes = self.get_movie_files()
         print(f"Found {len(self.movie_files)} suitable video files\n")
         
@@ -80,41 +263,124 @@ class MoviePlayer:
         self.playlist = list(self.movie_files)
         random.shuffle(self.playlist)
         self.current_index = 0
+        self._needs_resize = False
 
     def get_movie_files(self):
-        movie_files = [
-            os.path.join(self.movies_dir, f) for f in os.listdir(self.movies_dir)
-            if f.lower().endswith((".mov", ".mp4", ".avi", ".mkv"))
-        ]
+        with os.scandir(self.movies_dir) as it:
+            movie_entries = [
+                e for e in it
+                if e.name.rpartition(".")[2].lower() in VIDEO_EXTENSIONS and e.is_file()
+            ]
         movie_durations = {}
         movie_fps = {}
         movie_sizes = {}
         suitable_movies = []
         
-        print(f"Loading {len(movie_files)} video files...")
+        print(f"Loading {len(movie_entries)} video files...")
         
-        random.shuffle(movie_files)
+        random.shuffle(movie_entries)
         
-        for index, file in enumerate(movie_files, start=1):
+        for index, (file, metadata) in enumerate(self._load_movie_metadata(movie_entries), start=1):
+            if metadata is None:
+                continue
+            duration, fps, size = metadata
+            if duration >= self.min_interval:
+                movie_durations[file] = duration
+                movie_fps[file] = fps
+                movie_sizes[file] = size
+                suitable_movies.append(file)
+            print(f"Loaded {index}/{len(movie_entries)}: {os.path.basename(file)} "
+                  f"(Duration: {duration}s, FPS: {fps}, Size: {size[0]}x{size[1]})")
             if self.max_videos and len(suitable_movies) >= self.max_videos:
                 break
-            try:
-                with VideoFileClip(file) as clip:
-                    duration = int(clip.duration)
-                    fps = clip.fps
-                    size = clip.size
-                    if duration >= self.min_interval:
-                        movie_durations[file] = duration
-                        movie_fps[file] = fps
-                        movie_sizes[file] = size
-                        suitable_movies.append(file)
-                    print(f"Loaded {index}/{len(movie_files)}: {os.path.basename(file)} "
-                          f"(Duration: {duration}s, FPS: {fps}, Size: {size[0]}x{size[1]})")
-            except Exception as e:
-                print(f"Error loading {file}: {e}")
         
         return suitable_movies, movie_durations, movie_fps, movie_sizes
 
+    def _load_movie_metadata(self, movie_entries):
+        """Yield (file, (duration, fps, size)) for each os.DirEntry, or (file, None) on error.
+
+        Results come in the order of movie_entries. Files whose mtime and size
+        match the metadata cache are not probed again.
+        """
+        # Probes are independent and spend their time inside libav, so start
+        # them all in parallel; results are collected and printed on this thread
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count())
+        probes = []
+        try:
+            for entry in movie_entries:
+                file = entry.path
+                try:
+                    # DirEntry caches its stat result; on Windows it comes with the listing
+                    stat = entry.stat()
+                except OSError as e:
+                    probes.append((file, None, None, None, e))
+                    continue
+                key = os.path.abspath(file)
+                cached = self._metadata_cache.get(key)
+                if cached is not None and cached[:2] == (stat.st_mtime, stat.st_size):
+                    probes.append((file, key, stat, cached[2:], None))
+                else:
+                    probes.append((file, key, stat, executor.submit(self._probe_movie, file), None))
+
+            # Wait on each file in turn so the caller sees the shuffled order,
+            # and a max_videos cut is not biased towards already cached files
+            for file, key, stat, result, error in probes:
+                if isinstance(result, concurrent.futures.Future):
+                    try:
+                        result = result.result()
+                    except Exception as e:
+                        error = e
+                if error is not None:
+                    print(f"Error loading {file}: {error}")
+                    yield file, None
+                    continue
+                yield file, result
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            # Keep every probe that ran, including ones still in flight when
+            # the caller stopped reading
+            probed = False
+            for file, key, stat, result, error in probes:
+                if (isinstance(result, concurrent.futures.Future) and not result.cancelled()
+                        and result.exception() is None):
+                    self._metadata_cache[key] = (stat.st_mtime, stat.st_size) + result.result()
+                    probed = True
+            if probed:
+                self._save_metadata_cache()
+
+    def _load_metadata_cache(self):
+        """Load the {path: (mtime, filesize, duration, fps, size)} cache from disk"""
+        try:
+            with open(METADATA_CACHE_PATH, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"Ignoring unreadable metadata cache {METADATA_CACHE_PATH}: {e}")
+            return {}
+
+    def _save_metadata_cache(self):
+        try:
+            os.makedirs(os.path.dirname(METADATA_CACHE_PATH), exist_ok=True)
+            temp_path = METADATA_CACHE_PATH + ".tmp"
+            with open(temp_path, "wb") as f:
+                pickle.dump(self._metadata_cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, METADATA_CACHE_PATH)
+        except Exception as e:
+            print(f"Error saving metadata cache {METADATA_CACHE_PATH}: {e}")
+
+    def _probe_movie(self, file):
+        """Return (duration, fps, size) of a video file, read from its headers only"""
+        with av.open(file, metadata_errors="ignore") as container:
+            stream = container.streams.video[0]
+            if container.duration is not None:
+                duration = int(container.duration / av.time_base)
+            else:
+                duration = int(stream.duration * stream.time_base)
+            fps = float(stream.average_rate or stream.guessed_rate)
+            size = (stream.width, stream.height)
+        return duration, fps, size
+
     def calculate_window_size(self):
         """Calculate initial window size based on screen resolution"""
         screen_info = pygame.display.Info()
@@ -127,7 +393,9 @@ class MoviePlayer:
         
         return (window_w, window_h)
 
-    def calculate_display_size(self, video_size, window_size):
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def calculate_display_size(video_size, window_size):
         """Calculate the size to display the video maintaining aspect ratio and fitting window"""
         video_w, video_h = video_size
         window_w, window_h = window_size
@@ -164,6 +432,7 @@ class MoviePlayer:
         # Set initial window size based on screen resolution
         window_size = self.calculate_window_size()
         screen = pygame.display.set_mode(window_size, pygame.RESIZABLE)
+        self._window_size = screen.get_size()
         pygame.display.set_caption("Movie Player - Press 'S' to skip, 'Q' to quit")
         
         try:
@@ -193,80 +462,129 @@ class MoviePlayer:
         playback_fps = self.target_fps
         video_size = self.movie_sizes[movie_file]
         
-        play_duration = random.randint(
-            self.min_interval, 
-            min(self.max_interval, duration)
-        ) if duration >= self.min_interval else duration
+        randint = random.randint
+        longest_play = min(self.max_interval, duration)
+        if duration < self.min_interval:
+            play_duration = duration
+        elif longest_play == self.min_interval:
+            # Fixed-length clips (min_interval == max_interval) need no random draw
+            play_duration = longest_play
+        else:
+            play_duration = randint(self.min_interval, longest_play)
         
-        start_time = random.randint(0, duration - play_duration) if duration > play_duration else 0
+        start_time = randint(0, duration - play_duration) if duration > play_duration else 0
         end_time = start_time + play_duration
         
-        frame_queue = queue.Queue(maxsize=240)
-        loader = FrameLoader(movie_file, start_time, end_time, frame_queue, playback_fps)
+        display_size = self.calculate_display_size(video_size, self._window_size)
+        display_pos = self.calculate_centered_position(display_size, self._window_size)
+        self._needs_resize = False
+        
+        display_w, display_h = display_size
+        # The ring's capacity is how far the loader may read ahead of playback;
+        # slots hold display-size frames, so it is bounded in bytes, not frames
+        frame_shape = (display_h, display_w, 3)
+        frame_ring = FrameRing(FrameRing.capacity_for(frame_shape), frame_shape)
+        loader = FrameLoader(movie_file, start_time, end_time, frame_ring, playback_fps,
+                             display_size)
         loader.start()
 
+        # The filename, fps and size lines never change during a video,
+        # so render them once instead of on every frame
+        file_size_mb = os.path.getsize(movie_file) / (1024 * 1024)
+        filename = os.path.basename(movie_file)
+        self._static_info = [
+            (self._render_info_text(font, filename), (10, 10)),  # Add filename at the top
+            (self._render_info_text(font, f"FPS: {playback_fps}"), (10, 70)),
+            (self._render_info_text(font, f"Size: {file_size_mb:.2f} MB"), (10, 100))
+        ]
+        self._time_info = None
+        self._time_info_second = None
+        self._dropped_frames = 0
+        self._dropped_info = None
+        self._dropped_info_count = None
+
         try:
             self._play_frames(
-                screen, frame_queue, playback_fps, play_duration,
-                movie_file, font, loader, video_size
+                screen, frame_ring, playback_fps, play_duration,
+                font, loader, video_size, display_size, display_pos
             )
         finally:
             loader.stop()
             loader.join(timeout=1)
 
-    def _play_frames(self, screen, frame_queue, fps, duration, movie_file, font, loader, video_size):
+    def _play_frames(self, screen, frame_ring, fps, duration, font, loader, video_size,
+                     display_size, display_pos):
+        # Each frame is presented at its own timestamp relative to the first
+        # frame, on the monotonic clock, so pacing never drifts
         frame_time = 1.0 / fps
-        next_frame_time = time.time()
-        elapsed_time = 0
-        
-        file_size_mb = os.path.getsize(movie_file) / (1024 * 1024)
-        filename = os.path.basename(movie_file)
+        wall_start = None
+        clear_screen = True
+        info_rects = []
         
         while True:
-            current_time = time.time()
-            
-            if current_time < next_frame_time:
-                time.sleep(max(0, next_frame_time - current_time))
-                continue
-
             try:
-                frame = frame_queue.get(timeout=1)
-                if frame is None:  # End of video
+                item = frame_ring.get(timeout=1)
+                if item is None:  # End of video
                     break
             except queue.Empty:
                 if loader.error:
                     raise loader.error
                 print("Frame queue empty, skipping video.")
                 break
+            frame, elapsed_time = item
+
+            current_time = time.monotonic()
+            if wall_start is None:
+                wall_start = current_time - elapsed_time
+            target_time = wall_start + elapsed_time
+            if current_time < target_time:
+                time.sleep(target_time - current_time)
 
             if self._handle_events(screen):
                 break
 
+            # Display size and position only change when the window is resized
+            if self._needs_resize:
+                display_size = self.calculate_display_size(video_size, self._window_size)
+                display_pos = self.calculate_centered_position(display_size, self._window_size)
+                loader.set_target_size(display_size)
+                self._needs_resize = False
+                clear_screen = True
+
+            # When more than a frame late and a newer frame is already waiting,
+            # skip this one to catch up instead of presenting the backlog late
+            if current_time - target_time > frame_time and len(frame_ring) > 1:
+                self._dropped_frames += 1
+                continue
+
             # Convert and display frame
             try:
-                frame_surface = pygame.image.frombuffer(
-                    frame.tobytes(), frame.shape[1::-1], "RGB"
-                )
+                # Wrap the ring slot directly instead of copying it with tobytes();
+                # the slot stays valid until the next frame_ring.get()
+                if not frame.flags['C_CONTIGUOUS']:
+                    frame = np.ascontiguousarray(frame)
+                frame_surface = pygame.image.frombuffer(frame, frame.shape[1::-1], "RGB")
                 
-                # Calculate display size and position
-                window_size = screen.get_size()
-                display_size = self.calculate_display_size(video_size, window_size)
-                display_pos = self.calculate_centered_position(display_size, window_size)
-                
-                # Scale frame and position it
-                if display_size != video_size:
+                # Frames arrive pre-scaled by the loader; only frames decoded
+                # before a window resize still need scaling here
+                if frame_surface.get_size() != display_size:
                     frame_surface = pygame.transform.smoothscale(frame_surface, display_size)
                 
-                # Fill screen with black
-                screen.fill((0, 0, 0))
+                # The frame covers its whole area, so the full window only needs
+                # clearing when that area changes; otherwise just erase the
+                # overlay that may have been drawn over the letterbox bars
+                if clear_screen:
+                    screen.fill((0, 0, 0))
+                    clear_screen = False
+                else:
+                    for rect in info_rects:
+                        screen.fill((0, 0, 0), rect)
                 
                 # Blit frame at centered position
                 screen.blit(frame_surface, display_pos)
                 
                 # Update display information
-                self._update_display_info(
-                    screen, font, elapsed_time, duration, fps, file_size_mb, filename
-                )
+                info_rects = self._update_display_info(screen, font, elapsed_time, duration)
                 
                 pygame.display.flip()
                 
@@ -274,9 +592,6 @@ class MoviePlayer:
                 print(f"Error displaying frame: {e}")
                 continue
 
-            elapsed_time += frame_time
-            next_frame_time = current_time + frame_time
-
     def _handle_events(self, screen):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -290,30 +605,35 @@ class MoviePlayer:
                     sys.exit()
             elif event.type == pygame.VIDEORESIZE:
                 screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
+                self._window_size = screen.get_size()
+                self._needs_resize = True
         return False
 
-    def _update_display_info(self, screen, font, elapsed_time, duration, fps, file_size_mb, filename):
-        current = f"{int(elapsed_time // 60):02d}:{int(elapsed_time % 60):02d}"
-        total = f"{int(duration // 60):02d}:{int(duration % 60):02d}"
+    def _render_info_text(self, font, text):
+        """Render a line of info text onto a semi-transparent black background"""
+        text_surface = font.render(text, True, (255, 255, 255))
+        surface = pygame.Surface(text_surface.get_size(), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 128))
+        surface.blit(text_surface, (0, 0))
+        return surface
+
+    def _update_display_info(self, screen, font, elapsed_time, duration):
+        # The time line only changes once per second
+        elapsed_second = int(elapsed_time)
+        if elapsed_second != self._time_info_second:
+            current = f"{elapsed_second // 60:02d}:{elapsed_second % 60:02d}"
+            total = f"{int(duration // 60):02d}:{int(duration % 60):02d}"
+            self._time_info = self._render_info_text(font, f"Time: {current} / {total}")
+            self._time_info_second = elapsed_second
         
-        info_texts = [
-            (filename, (10, 10)),  # Add filename at the top
-            (f"Time: {current} / {total}", (10, 40)),
-            (f"FPS: {fps}", (10, 70)),
-            (f"Size: {file_size_mb:.2f} MB", (10, 100))
-        ]
+        if self._dropped_frames != self._dropped_info_count:
+            self._dropped_info = self._render_info_text(font, f"Dropped: {self._dropped_frames}")
+            self._dropped_info_count = self._dropped_frames
         
-        # Create semi-transparent background for text
-        for text, pos in info_texts:
-            text_surface = font.render(text, True, (255, 255, 255))
-            text_rect = text_surface.get_rect(topleft=pos)
-            # Draw black background with alpha
-            s = pygame.Surface((text_rect.width, text_rect.height))
-            s.fill((0, 0, 0))
-            s.set_alpha(128)
-            screen.blit(s, text_rect)
-            # Draw text
-            screen.blit(text_surface, pos)
+        rects = [screen.blit(surface, pos) for surface, pos in self._static_info]
+        rects.append(screen.blit(self._time_info, (10, 40)))
+        rects.append(screen.blit(self._dropped_info, (10, 130)))
+        return rects
 
 def main():
     movies_dir = sys.argv[1] if len(sys.argv) >= 2 else "."
@@ -0,0 +1,75 @@
+import os
+import sys
+
+import av
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from RandomVideo import FrameLoader, FrameRing
+
+WIDTH, HEIGHT, BITS = 160, 32, 10
+BAND = WIDTH // BITS
+
+
+def make_indexed_clip(path, fps, seconds):
+    """Write a lossless clip whose frames encode their index as black/white bands"""
+    container = av.open(str(path), "w")
+    stream = container.add_stream("ffv1", rate=fps)
+    stream.width, stream.height = WIDTH, HEIGHT
+    stream.pix_fmt = "yuv420p"
+    for index in range(fps * seconds):
+        image = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+        for bit in range(BITS):
+            if index >> bit & 1:
+                image[:, bit * BAND:(bit + 1) * BAND] = 255
+        for packet in stream.encode(av.VideoFrame.from_ndarray(image, format="rgb24")):
+            container.mux(packet)
+    for packet in stream.encode():
+        container.mux(packet)
+    container.close()
+
+
+def decode_index(frame):
+    row = frame[HEIGHT // 2]
+    return sum(1 << bit for bit in range(BITS) if row[bit * BAND + BAND // 2, 0] > 128)
+
+
+def load_indices(path, start_time, end_time, fps):
+    ring = FrameRing(1024, (HEIGHT, WIDTH, 3))
+    loader = FrameLoader(str(path), start_time, end_time, ring, fps, (WIDTH, HEIGHT))
+    loader.run()
+    assert loader.error is None
+    indices = []
+    while True:
+        item = ring.get()
+        if item is None:
+            return indices
+        indices.append(decode_index(item[0]))
+
+
+@pytest.mark.parametrize("fps", [24, 25, 30])
+def test_same_rate_playback_yields_consecutive_frames(tmp_path, fps):
+    path = tmp_path / "indexed.mkv"
+    make_indexed_clip(path, fps, 12)
+    indices = load_indices(path, 2, 10, fps)
+    assert indices == list(range(2 * fps, 10 * fps))
+
+
+def test_half_rate_playback_takes_every_other_frame(tmp_path):
+    path = tmp_path / "indexed.mkv"
+    make_indexed_clip(path, 30, 6)
+    indices = load_indices(path, 1, 5, 15)
+    assert indices == list(range(30, 150, 2))
+
+
+@pytest.mark.parametrize("source_fps, playback_fps", [(24, 30), (25, 24), (30, 24)])
+def test_resampled_playback_never_goes_backwards_or_jumps(tmp_path, source_fps, playback_fps):
+    path = tmp_path / "indexed.mkv"
+    make_indexed_clip(path, source_fps, 6)
+    indices = load_indices(path, 1, 5, playback_fps)
+    assert len(indices) == 4 * playback_fps
+    steps = {b - a for a, b in zip(indices, indices[1:])}
+    assert steps <= {0, 1, 2}
+    if playback_fps >= source_fps:
+        assert steps <= {0, 1}